@@ -1,5 +1,6 @@
 import logging
 import os
+import random
 import requests
 import sys
 import telegram
@@ -8,13 +9,19 @@ from dotenv import load_dotenv
 from http import HTTPStatus
 from telegram.error import TelegramError
 
-load_dotenv()
+# .env нужен только там, где переменные ещё не попали в окружение процесса
+# (преднастроенные окружения обходятся без чтения файла).
+if None in (os.getenv('PRACTICUM_TOKEN'),
+            os.getenv('TELEGRAM_TOKEN'),
+            os.getenv('TELEGRAM_CHAT_ID')):
+    load_dotenv()
 
 PRACTICUM_TOKEN: str = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN: str = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID: str = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD: int = 600
+REQUEST_TIMEOUT: int = 55
 ENDPOINT: str = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS: dict = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
@@ -24,8 +31,19 @@ HOMEWORK_VERDICTS: dict = {
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
 
+# Готовые шаблоны сообщений: на каждое обновление остаётся подставить
+# только название работы.
+VERDICT_TEMPLATES: dict = {
+    status: f'Изменился статус проверки работы "{{name}}". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+# Маркер отсутствующего ключа: отличает пропавший "homeworks"
+# от присутствующего, но с некорректным значением (например, None).
+_MISSING = object()
+
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(os.getenv('LOG_LEVEL', 'DEBUG'))
 handler = logging.StreamHandler(stream=sys.stdout)
 logger.addHandler(handler)
 formatter = logging.Formatter(
@@ -34,12 +52,21 @@ formatter = logging.Formatter(
 handler.setFormatter(formatter)
 
 
+class MissingEnvironmentVariableError(Exception):
+    """Отсутствуют обязательные переменные окружения."""
+
+
 def check_tokens() -> bool:
     """Проверка доступности переменных окружения."""
-    variables: list = [PRACTICUM_TOKEN,
-                       TELEGRAM_TOKEN,
-                       TELEGRAM_CHAT_ID]
-    return all(variables)
+    variables: tuple = ((PRACTICUM_TOKEN, 'PRACTICUM_TOKEN'),
+                        (TELEGRAM_TOKEN, 'TELEGRAM_TOKEN'),
+                        (TELEGRAM_CHAT_ID, 'TELEGRAM_CHAT_ID'))
+    tokens_available = True
+    for value, name in variables:
+        if not value:
+            logger.critical('Отсутствует переменная окружения %s', name)
+            tokens_available = False
+    return tokens_available
 
 
 def send_message(bot: telegram.Bot, message: str) -> None:
@@ -49,15 +76,20 @@ def send_message(bot: telegram.Bot, message: str) -> None:
         bot.send_message(TELEGRAM_CHAT_ID, message)
         logger.debug('Сообщение отправлено')
     except TelegramError as error:
-        logger.error(f'Ошибка отправки сообщения: {error}')
+        logger.error('Ошибка отправки сообщения: %s', error)
 
 
 def get_api_answer(timestamp: dict) -> dict:
     """Отправка запроса к эндпоинту."""
     try:
-        homeworks = requests.get(ENDPOINT, headers=HEADERS, params=timestamp)
+        homeworks = requests.get(ENDPOINT,
+                                 headers=HEADERS,
+                                 params=timestamp,
+                                 timeout=REQUEST_TIMEOUT)
     except requests.RequestException as error:
-        logger.error(f'Ошибка при запросе к эндпоинту: {error}')
+        raise ConnectionError(
+            f'Ошибка при запросе к эндпоинту: {error}'
+        ) from error
 
     if homeworks.status_code != HTTPStatus.OK:
         raise ConnectionError(f'Эндпоинт {ENDPOINT} недоступен. '
@@ -67,39 +99,34 @@ def get_api_answer(timestamp: dict) -> dict:
 
 def check_response(response: dict) -> dict:
     """Проверка ответа API."""
-    if type(response) is not dict:
+    if not isinstance(response, dict):
         raise TypeError(f'Некорректный тип данных: {type(response)}')
-    if 'homeworks' not in response:
+    homeworks = response.get('homeworks', _MISSING)
+    if homeworks is _MISSING:
         raise KeyError('Отсутствует ключ "homeworks"')
-    if type(response['homeworks']) is not list:
-        raise TypeError(
-            f'Некорректный тип данных {type(response["homeworks"])}'
-        )
-
-    if not response['homeworks']:
-        return {}
-    return response['homeworks'][0]
+    if not isinstance(homeworks, list):
+        raise TypeError(f'Некорректный тип данных {type(homeworks)}')
+    return homeworks[0] if homeworks else {}
 
 
 def parse_status(homework: dict) -> str:
     """Получение информации об обновлении статуса проверки."""
     if homework:
-        if 'homework_name' not in homework:
+        homework_name = homework.get('homework_name')
+        if homework_name is None:
             raise KeyError('Отсутствует ключ "homework_name"')
-        if 'status' not in homework:
+        status = homework.get('status')
+        if status is None:
             raise KeyError('Отсутствует ключ "status"')
-        if not homework['status']:
+        if not status:
             raise ValueError('Статус проверки работы пуст')
-        if homework['status'] not in HOMEWORK_VERDICTS:
+        template = VERDICT_TEMPLATES.get(status)
+        if template is None:
             raise KeyError(
                 'Статус проверки не соответствует ожидаемым вариантам'
             )
 
-        homework_name = homework['homework_name']
-        status = homework['status']
-        verdict = HOMEWORK_VERDICTS[status]
-        message = ('Изменился статус проверки работы '
-                   f'"{homework_name}". {verdict}')
+        message = template.format(name=homework_name)
     else:
         message = 'Статус проверки работы не изменился'
 
@@ -112,36 +139,40 @@ def main() -> None:
     if not check_tokens():
         logger.critical('Отсутствуют обязательные переменные окружения! '
                         'Работа программы принудительно завершена')
-        sys.exit()
+        raise MissingEnvironmentVariableError(
+            'Отсутствуют обязательные переменные окружения'
+        )
 
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     logger.info('Бот запущен!')
     timestamp = {'from_date': int(time.time())}
     previous_message = ''
+    backoff = 1
 
     while True:
         try:
             response = get_api_answer(timestamp)
 
-            current_date = response.get('current_date')
-            timestamp = {'from_date': current_date}
+            timestamp['from_date'] = response.get('current_date',
+                                                  timestamp['from_date'])
 
             homework = check_response(response)
             message = parse_status(homework)
-            if message == previous_message:
-                continue
-            send_message(bot, message)
-            previous_message = message
+            if message != previous_message:
+                send_message(bot, message)
+                previous_message = message
 
         except Exception as error:
             message = f'Сбой в работе программы: {error}'
             logger.error(message)
-            if message == previous_message:
-                continue
-            send_message(bot, message)
-            previous_message = message
-
-        finally:
+            if message != previous_message:
+                send_message(bot, message)
+                previous_message = message
+            time.sleep(backoff + random.random())
+            backoff = min(backoff * 2, RETRY_PERIOD)
+
+        else:
+            backoff = 1
             time.sleep(RETRY_PERIOD)
 
 